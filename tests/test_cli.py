@@ -0,0 +1,27 @@
+"""Tests for the command-line interface."""
+
+from click.testing import CliRunner
+
+from video_downloader.cli import main
+from video_downloader.workqueue import WorkQueue
+
+
+def test_enqueue_into_unusable_queue_reports_queue_error(tmp_path):
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+
+    result = CliRunner().invoke(main, ["--queue", str(blocker / "queue"), "https://example.com/a"])
+
+    assert result.exit_code == 7
+    assert "Queue Error" in result.output
+
+
+def test_enqueue_write_failure_reports_queue_error(tmp_path, monkeypatch):
+    def fail(self, path, payload):
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(WorkQueue, "_write_atomic", fail)
+    result = CliRunner().invoke(main, ["--queue", str(tmp_path / "queue"), "https://example.com/a"])
+
+    assert result.exit_code == 7
+    assert "No space left on device" in result.output
@@ -0,0 +1,71 @@
+"""Tests for Downloader's use of yt-dlp."""
+
+import logging
+
+import pytest
+
+from video_downloader import downloader as downloader_module
+from video_downloader.downloader import Downloader
+
+
+class FakeYDL:
+    """Records which yt-dlp entry points were called."""
+
+    calls = []
+
+    def __init__(self, opts):
+        self.opts = opts
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def urlopen(self, req):
+        return None
+
+    def download(self, urls):
+        FakeYDL.calls.append(("download", urls))
+
+    def extract_info(self, url, download=True):
+        FakeYDL.calls.append(("extract_info", url))
+        return {"id": "x"}
+
+    def process_ie_result(self, info, download=True):
+        FakeYDL.calls.append(("process_ie_result", info))
+
+
+@pytest.fixture
+def fake_downloader(monkeypatch):
+    FakeYDL.calls = []
+    monkeypatch.setattr(downloader_module.shutil, "which", lambda name: "/usr/bin/" + name)
+    monkeypatch.setattr(downloader_module.yt_dlp, "YoutubeDL", FakeYDL)
+
+    class FakeProgress:
+        tasks = {}
+
+    return Downloader(FakeProgress())
+
+
+def test_download_without_info_uses_ydl_download(fake_downloader, tmp_path):
+    fake_downloader.download("https://example.com/v", str(tmp_path))
+    assert FakeYDL.calls == [("download", ["https://example.com/v"])]
+
+
+def test_download_with_prefetched_info_skips_extraction(fake_downloader, tmp_path):
+    info = {"id": "x"}
+    fake_downloader.download("https://example.com/v", str(tmp_path), info=info)
+    assert FakeYDL.calls == [("process_ie_result", info)]
+
+
+def test_retryable_failure_is_logged_as_warning(fake_downloader, tmp_path, monkeypatch, caplog):
+    def fail(self, info, download=True):
+        raise downloader_module.yt_dlp.utils.DownloadError("HTTP Error 403: Forbidden")
+
+    monkeypatch.setattr(FakeYDL, "process_ie_result", fail)
+    with pytest.raises(downloader_module.DownloadError):
+        fake_downloader.download("https://example.com/v", str(tmp_path), info={"id": "x"}, log_errors=False)
+
+    assert caplog.records
+    assert all(record.levelno < logging.ERROR for record in caplog.records)
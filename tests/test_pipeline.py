@@ -0,0 +1,161 @@
+"""Tests for the pipelined prefetch runner."""
+
+import logging
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+
+import pytest
+
+from video_downloader import pipeline
+from video_downloader.exceptions import DownloadError
+from video_downloader.pipeline import PipelinedRunner, signed_url_expiry
+
+
+class FakeDownloader:
+    """Records extract/download calls; behaviour is tuned per test."""
+
+    def __init__(self, extract_delay=0.0, expires_in=3600.0, reject=(), fail=()):
+        self.extract_delay = extract_delay
+        self.expires_in = expires_in
+        self.reject = set(reject)
+        self.fail = set(fail)
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def extract(self, url, **options):
+        with self.lock:
+            self.calls.append(("extract", url, options))
+        time.sleep(self.extract_delay)
+        return {"url": f"https://cdn.example.com/{url}?expire={time.time() + self.expires_in}"}
+
+    def download(self, url, info=None, log_errors=True, **options):
+        with self.lock:
+            self.calls.append(("download", url, info is not None, log_errors, options))
+        if url in self.fail:
+            raise DownloadError("Download failed: unsupported URL")
+        if url in self.reject and info is not None:
+            raise DownloadError("Download failed: HTTP Error 403: Forbidden")
+
+
+def _downloads(fake):
+    return [(c[1], c[2]) for c in fake.calls if c[0] == "download"]
+
+
+def test_signed_url_expiry_formats():
+    assert signed_url_expiry({"url": "https://a/x?expire=100"}) == 100
+    assert signed_url_expiry({"url": "https://a/x?Expires=200&sig=1"}) == 200
+    assert signed_url_expiry({"url": "https://a/v/expire/50/itag/22"}) == 50
+    assert signed_url_expiry(
+        {"url": "https://s3/x?X-Amz-Date=20260101T000000Z&X-Amz-Expires=60"}
+    ) == 1767225600 + 60
+    assert signed_url_expiry(
+        {"requested_formats": [{"url": "https://a/v?expire=300"}, {"url": "https://a/a?expire=100"}]}
+    ) == 100
+    assert signed_url_expiry({"entries": [{"url": "https://a/1?expire=30"}, {"url": "https://a/2"}]}) == 30
+    assert signed_url_expiry({"url": "https://a/plain.mp4"}) is None
+
+
+def test_runs_in_order_with_prefetched_info():
+    fake = FakeDownloader()
+    assert PipelinedRunner(fake, prefetch=2).run(["a", "b", "c"], download_path="/tmp") == 3
+    assert _downloads(fake) == [("a", True), ("b", True), ("c", True)]
+
+
+def test_extraction_overlaps_download():
+    fake = FakeDownloader(extract_delay=0.2)
+    start = time.monotonic()
+    PipelinedRunner(fake, prefetch=3).run(["a", "b", "c", "d"])
+    # Serial extraction alone would take 0.8s
+    assert time.monotonic() - start < 0.6
+
+
+def test_expired_info_is_resolved_again():
+    fake = FakeDownloader(expires_in=10)
+    PipelinedRunner(fake).run(["a"])
+    assert _downloads(fake) == [("a", False)]
+
+
+def test_rejected_info_is_retried_without_error_logs(caplog):
+    fake = FakeDownloader(reject={"a"})
+    with caplog.at_level(logging.WARNING):
+        PipelinedRunner(fake).run(["a"])
+
+    assert _downloads(fake) == [("a", True), ("a", False)]
+    assert fake.calls[1][3] is False  # prefetched attempt does not log errors
+    assert not [r for r in caplog.records if r.levelno >= logging.ERROR]
+
+
+def test_failure_does_not_wait_for_running_extractions():
+    fake = FakeDownloader(fail={"a"})
+    slow = {"b", "c"}
+
+    def extract(url, **options):
+        if url in slow:
+            time.sleep(2)
+        return {"url": f"https://cdn.example.com/{url}"}
+
+    fake.extract = extract
+    start = time.monotonic()
+    with pytest.raises(DownloadError):
+        PipelinedRunner(fake, prefetch=2).run(["a", "b", "c", "d"])
+    assert time.monotonic() - start < 1.5
+
+
+def test_failure_does_not_delay_process_exit():
+    script = textwrap.dedent(
+        """
+        import sys
+        import time
+
+        from video_downloader.exceptions import DownloadError
+        from video_downloader.pipeline import PipelinedRunner
+
+        class SlowExtractDownloader:
+            def extract(self, url, **options):
+                if url != "a":
+                    time.sleep(10)
+                return {"url": "https://cdn.example.com/" + url}
+
+            def download(self, url, **options):
+                raise DownloadError("Download failed: unsupported URL")
+
+        try:
+            PipelinedRunner(SlowExtractDownloader(), prefetch=2).run(["a", "b", "c"])
+        except DownloadError:
+            sys.exit(1)
+        """
+    )
+    start = time.monotonic()
+    result = subprocess.run([sys.executable, "-c", script], timeout=30)
+
+    assert result.returncode == 1
+    # The interpreter must not join the extraction threads still sleeping
+    assert time.monotonic() - start < 5
+
+
+def test_site_is_passed_through_like_single_downloads(monkeypatch):
+    monkeypatch.setattr(pipeline, "get_auth_options", lambda site: {})
+    fake = FakeDownloader()
+    PipelinedRunner(fake).run(["a"], site="example", cookies_path="cookies.txt")
+
+    options = fake.calls[-1][4]
+    assert options["site"] == "example"
+    assert options["cookies_path"] == "cookies.txt"
+
+
+def test_stored_credentials_are_resolved_once(monkeypatch):
+    lookups = []
+
+    def fake_auth(site):
+        lookups.append(site)
+        return {"username": "user", "password": "secret"}
+
+    monkeypatch.setattr(pipeline, "get_auth_options", fake_auth)
+    fake = FakeDownloader()
+    PipelinedRunner(fake).run(["a", "b"], site="example")
+
+    assert lookups == ["example"]
+    assert all(c[-1]["username"] == "user" for c in fake.calls)
@@ -0,0 +1,107 @@
+"""Tests for streaming output through a bounded buffer."""
+
+import sys
+import threading
+import time
+from http.cookiejar import Cookie
+
+import pytest
+
+from video_downloader.exceptions import DownloadError
+from video_downloader.stream import StreamPump, build_ffmpeg_command
+
+CHUNK = 64 * 1024
+
+
+def _emit_bytes(count: int) -> list:
+    """A stand-in for ffmpeg that writes `count` chunks of zeros to stdout."""
+    script = f"import sys\nfor _ in range({count}): sys.stdout.buffer.write(bytes({CHUNK}))"
+    return [sys.executable, "-c", script]
+
+
+def _cookie(name: str, value: str) -> Cookie:
+    return Cookie(
+        0, name, value, None, False, ".example.com", True, True, "/", True,
+        False, None, False, None, None, {},
+    )
+
+
+def test_ffmpeg_command_passes_cookies_tls_and_reconnect():
+    info = {"url": "https://cdn.example.com/v.mp4", "ext": "mp4", "http_headers": {"User-Agent": "ua"}}
+    command = build_ffmpeg_command(info, False, "192", 30, cookies=[_cookie("sid", "abc")])
+
+    assert command[command.index("-cookies") + 1] == "sid=abc; path=/; domain=.example.com;\r\n"
+    assert command[command.index("-headers") + 1] == "User-Agent: ua\r\n"
+    assert command[command.index("-tls_verify") + 1] == "1"
+    assert "-reconnect" in command
+    assert command.index("-cookies") < command.index("-i")
+    assert command[-3:] == ["-f", "mp4", "pipe:1"]
+
+
+def test_ffmpeg_command_honours_insecure_and_no_retries():
+    info = {"url": "https://cdn.example.com/a.webm", "ext": "webm"}
+    command = build_ffmpeg_command(info, True, "320", 30, verify_ssl=False, max_retries=0)
+
+    assert command[command.index("-tls_verify") + 1] == "0"
+    assert "-reconnect" not in command
+    assert command[command.index("-b:a") + 1] == "320k"
+
+
+def test_ffmpeg_command_skips_tls_options_for_plain_http():
+    info = {"url": "http://cdn.example.com/v.mp4", "ext": "mp4"}
+    command = build_ffmpeg_command(info, False, "192", 30, cookies=[_cookie("sid", "abc")])
+
+    assert "-tls_verify" not in command
+    assert "-cookies" in command
+    assert "-reconnect" in command
+
+
+def test_pump_streams_everything_to_slow_fifo_reader(tmp_path):
+    fifo = tmp_path / "out.fifo"
+    received = []
+    statuses = []
+
+    def consume():
+        while not fifo.exists():
+            time.sleep(0.01)
+        with open(fifo, "rb") as f:
+            while True:
+                data = f.read(CHUNK)
+                if not data:
+                    break
+                received.append(len(data))
+
+    reader = threading.Thread(target=consume)
+    reader.start()
+    pump = StreamPump(_emit_bytes(100), str(fifo), [lambda d: statuses.append(d["status"])], buffer_chunks=4)
+    written = pump.run()
+    reader.join()
+
+    assert written == 100 * CHUNK
+    assert sum(received) == written
+    assert statuses[-1] == "finished"
+
+
+def test_pump_reports_consumer_closing_early(tmp_path):
+    fifo = tmp_path / "out.fifo"
+
+    def consume_a_little():
+        while not fifo.exists():
+            time.sleep(0.01)
+        with open(fifo, "rb") as f:
+            f.read(1000)
+
+    reader = threading.Thread(target=consume_a_little)
+    reader.start()
+    with pytest.raises(DownloadError, match="closed the pipe"):
+        StreamPump(_emit_bytes(200), str(fifo), []).run()
+    reader.join()
+
+
+def test_pump_reports_ffmpeg_failure(tmp_path):
+    target = tmp_path / "out.bin"
+    target.touch()
+    failing = [sys.executable, "-c", "import sys; sys.stderr.write('boom\\n'); sys.exit(3)"]
+
+    with pytest.raises(DownloadError, match="code 3: boom"):
+        StreamPump(failing, str(target), []).run()
@@ -0,0 +1,89 @@
+"""Tests for the Chrome trace exporter."""
+
+import json
+import pstats
+import threading
+
+from video_downloader.trace import Tracer
+
+
+def _events(trace: dict, category: str) -> list:
+    return [e for e in trace["traceEvents"] if e.get("cat") == category]
+
+
+def test_progress_hook_records_transfer_and_fragments():
+    tracer = Tracer()
+    for index in (1, 2, 3):
+        tracer.progress_hook(
+            {"status": "downloading", "filename": "a.mp4", "fragment_index": index, "fragment_count": 3}
+        )
+    tracer.progress_hook({"status": "finished", "filename": "a.mp4", "elapsed": 1.5})
+
+    trace = tracer.to_dict()
+    assert [e["name"] for e in _events(trace, "fragment")] == ["fragment 1", "fragment 2", "fragment 3"]
+    (transfer,) = _events(trace, "download")
+    assert transfer["ph"] == "X"
+    assert transfer["args"]["filename"] == "a.mp4"
+    assert transfer["args"]["elapsed"] == 1.5
+
+
+def test_postprocessor_hook_records_span():
+    tracer = Tracer()
+    tracer.postprocessor_hook({"status": "started", "postprocessor": "Merger", "info_dict": {"id": "x"}})
+    tracer.postprocessor_hook(
+        {"status": "finished", "postprocessor": "Merger", "info_dict": {"id": "x", "filepath": "x.mp4"}}
+    )
+
+    (span,) = _events(tracer.to_dict(), "postprocess")
+    assert span["name"] == "Merger"
+    assert span["args"]["filepath"] == "x.mp4"
+
+
+def test_instrument_and_span_nest_http_requests():
+    class FakeYDL:
+        def urlopen(self, req):
+            return "response"
+
+    tracer = Tracer()
+    ydl = FakeYDL()
+    tracer.instrument(ydl)
+    with tracer.span("extract", url="https://example.com"):
+        assert ydl.urlopen("https://example.com/api") == "response"
+
+    trace = tracer.to_dict()
+    (http,) = _events(trace, "http")
+    (extract,) = _events(trace, "phase")
+    assert http["args"]["url"] == "https://example.com/api"
+    assert extract["ts"] <= http["ts"]
+    assert http["ts"] + http["dur"] <= extract["ts"] + extract["dur"]
+
+
+def test_save_closes_open_spans(tmp_path):
+    tracer = Tracer()
+    tracer.progress_hook({"status": "downloading", "filename": "a.mp4"})
+    path = tmp_path / "trace.json"
+    tracer.save(str(path))
+
+    (transfer,) = _events(json.loads(path.read_text()), "download")
+    assert transfer["args"]["error"] is True
+
+
+def _busy_in_worker_thread():
+    return sum(i * i for i in range(20000))
+
+
+def test_profile_covers_worker_threads(tmp_path):
+    tracer = Tracer(profile=True)
+    thread = threading.Thread(target=_busy_in_worker_thread)
+    thread.start()
+    thread.join()
+
+    path = tmp_path / "trace.json"
+    tracer.save(str(path))
+
+    assert (tmp_path / "trace.json.prof").exists()
+    trace = json.loads(path.read_text())
+    assert trace["otherData"]["profile"] == f"{path}.prof"
+
+    stats = pstats.Stats(str(tmp_path / "trace.json.prof"))
+    assert any(func == "_busy_in_worker_thread" for _, _, func in stats.stats)
@@ -0,0 +1,113 @@
+"""Tests for the shared lease-directory work queue."""
+
+import json
+import os
+import time
+import threading
+import multiprocessing
+
+from video_downloader.exceptions import DownloadError
+from video_downloader.workqueue import WorkQueue, Job, run_worker
+
+
+def _worker(root: str, index: int) -> int:
+    """Drain the queue from a separate process, logging each handled job."""
+    queue = WorkQueue(root, worker_id=f"worker-{index}", lease_seconds=1.0)
+
+    def handler(job: Job) -> None:
+        time.sleep(0.01)
+        with open(os.path.join(root, "handled.log"), "a") as f:
+            f.write(f"{job.job_id}\n")
+        if job.url.endswith("/fail"):
+            raise DownloadError("boom")
+
+    return run_worker(queue, handler, poll_interval=0.1)
+
+
+def _done_records(queue: WorkQueue) -> dict:
+    return {p.stem: json.loads(p.read_text()) for p in queue.done_dir.glob("*.json")}
+
+
+def test_multiple_processes_record_each_job_once(tmp_path):
+    queue = WorkQueue(tmp_path)
+    job_ids = [queue.enqueue(f"https://example.com/{n}") for n in range(40)]
+    failing = queue.enqueue("https://example.com/fail")
+
+    # A dead node holding the first job: its lease expires and must be reclaimed
+    dead = WorkQueue(tmp_path, worker_id="dead", lease_seconds=0.2)
+    abandoned = dead.claim()
+    assert abandoned.job_id == job_ids[0]
+
+    with multiprocessing.Pool(4) as pool:
+        completed = pool.starmap(_worker, [(str(tmp_path), n) for n in range(4)])
+
+    handled = (tmp_path / "handled.log").read_text().split()
+    assert sorted(handled) == sorted(job_ids + [failing])
+    assert sum(completed) == len(job_ids)
+
+    records = _done_records(queue)
+    assert set(records) == set(job_ids + [failing])
+    assert records[failing]["status"] == "failed"
+    assert queue.stats() == {"pending": 0, "leased": 0, "done": len(job_ids) + 1}
+
+    # The dead node coming back must not record a second completion
+    assert dead.complete(abandoned) is False
+
+
+def test_empty_lease_is_reclaimed_after_lease_seconds(tmp_path):
+    queue = WorkQueue(tmp_path, lease_seconds=0.2)
+    job_id = queue.enqueue("https://example.com/a")
+
+    # A worker crashed between creating the lease and writing it
+    (queue.leases_dir / f"{job_id}.lease").touch()
+    assert queue.claim() is None
+    assert queue.stats()["leased"] == 1
+
+    time.sleep(0.3)
+    job = queue.claim()
+    assert job is not None and job.job_id == job_id
+
+
+def test_live_lease_is_not_reclaimed(tmp_path):
+    owner = WorkQueue(tmp_path, worker_id="owner", lease_seconds=30)
+    owner.enqueue("https://example.com/a")
+    assert owner.claim() is not None
+
+    assert WorkQueue(tmp_path, worker_id="other").claim() is None
+
+
+def test_heartbeat_refuses_expired_lease(tmp_path):
+    queue = WorkQueue(tmp_path, lease_seconds=0.1)
+    queue.enqueue("https://example.com/a")
+    job = queue.claim()
+
+    assert queue.heartbeat(job) is True
+    time.sleep(0.2)
+    assert queue.heartbeat(job) is False
+
+
+def test_lost_lease_is_not_completed(tmp_path):
+    queue = WorkQueue(tmp_path, worker_id="slow", lease_seconds=0.3)
+    queue.enqueue("https://example.com/a")
+    thief = WorkQueue(tmp_path, worker_id="thief", lease_seconds=30)
+
+    def handler(job: Job) -> None:
+        # Simulate the lease being broken and re-acquired while we work
+        (queue.leases_dir / f"{job.job_id}.lease").unlink()
+        stolen = thief.claim()
+        time.sleep(0.25)
+        # The new owner finishes only after this worker has moved on
+        threading.Timer(0.3, thief.complete, [stolen]).start()
+
+    assert run_worker(queue, handler, poll_interval=0.05) == 0
+    assert [r["worker"] for r in _done_records(queue).values()] == ["thief"]
+
+
+def test_unreadable_job_is_failed_and_claiming_continues(tmp_path):
+    queue = WorkQueue(tmp_path)
+    (queue.jobs_dir / "00000000000000000000-broken.json").write_text("{not json")
+    good = queue.enqueue("https://example.com/a")
+
+    job = queue.claim()
+    assert job is not None and job.job_id == good
+    assert _done_records(queue)["00000000000000000000-broken"]["status"] == "failed"
@@ -8,6 +8,9 @@ methods and progress tracking.
 
 from .downloader import Downloader
 from .auth import CredentialManager, get_auth_options
+from .pipeline import PipelinedRunner
+from .trace import Tracer
+from .workqueue import WorkQueue, Job, run_worker
 from .exceptions import (
     VideoDownloaderError,
     DownloadError,
@@ -16,6 +19,7 @@ from .exceptions import (
     DependencyError,
     AuthenticationError,
     ValidationError,
+    QueueError,
 )
 
 __version__ = "2.0.0"
@@ -23,6 +27,11 @@ __all__ = [
     "Downloader",
     "CredentialManager",
     "get_auth_options",
+    "PipelinedRunner",
+    "Tracer",
+    "WorkQueue",
+    "Job",
+    "run_worker",
     "VideoDownloaderError",
     "DownloadError",
     "NetworkError",
@@ -30,4 +39,5 @@ __all__ = [
     "DependencyError",
     "AuthenticationError",
     "ValidationError",
+    "QueueError",
 ]
@@ -8,7 +8,8 @@ with multiple authentication methods and configuration options.
 import os
 import sys
 import logging
-from typing import Optional
+from pathlib import Path
+from typing import Optional, Tuple
 from urllib.parse import urlparse
 
 import click
@@ -17,22 +18,28 @@ from rich.console import Console
 from rich.logging import RichHandler
 
 from .downloader import Downloader
+from .pipeline import PipelinedRunner, DEFAULT_PREFETCH
+from .trace import Tracer
+from .workqueue import WorkQueue, DEFAULT_LEASE_SECONDS, run_worker
 from .exceptions import (
     DownloadError,
     NetworkError,
     FormatError,
     DependencyError,
     ValidationError,
+    QueueError,
 )
 
+# Shared by log output, progress and messages so streaming mode can move them all to stderr
+console = Console()
+
 # Setup logging with rich handler
 logging.basicConfig(
     level=logging.INFO,
     format="%(message)s",
-    handlers=[RichHandler(rich_tracebacks=True, show_time=False)],
+    handlers=[RichHandler(console=console, rich_tracebacks=True, show_time=False)],
 )
 logger = logging.getLogger(__name__)
-console = Console()
 
 
 def validate_url(ctx, param, value: str) -> str:
@@ -63,8 +70,46 @@ def validate_url(ctx, param, value: str) -> str:
         raise click.BadParameter(f"Invalid URL: {e}") from e
 
 
+def validate_urls(ctx, param, value: Tuple[str, ...]) -> Tuple[str, ...]:
+    """
+    Validate every URL given on the command line.
+
+    Args:
+        ctx: Click context
+        param: Click parameter
+        value: URL strings to validate
+
+    Returns:
+        Validated URLs
+
+    Raises:
+        click.BadParameter: If any URL is invalid
+    """
+    return tuple(validate_url(ctx, param, url) for url in value)
+
+
+def validate_output(ctx, param, value: str) -> str:
+    """
+    Validate the output option: a directory, or "-" to stream to stdout.
+
+    Args:
+        ctx: Click context
+        param: Click parameter
+        value: Output path
+
+    Returns:
+        Validated output path
+
+    Raises:
+        click.BadParameter: If the path is an existing file
+    """
+    if value != "-" and os.path.isfile(value):
+        raise click.BadParameter("Output must be a directory, or '-' to stream to stdout.")
+    return value
+
+
 @click.command()
-@click.argument("url", callback=validate_url)
+@click.argument("urls", nargs=-1, callback=validate_urls)
 @click.option(
     "-f",
     "--format",
@@ -77,9 +122,16 @@ def validate_url(ctx, param, value: str) -> str:
     "-o",
     "--output",
     "output_path",
-    type=click.Path(file_okay=False, dir_okay=True, writable=True, resolve_path=True),
+    type=click.Path(dir_okay=True, writable=True, resolve_path=True, allow_dash=True),
+    callback=validate_output,
     default=os.path.expanduser("~/Downloads"),
-    help="Output directory.",
+    help="Output directory, or '-' to stream to stdout without touching disk.",
+)
+@click.option(
+    "--pipe",
+    "pipe_path",
+    type=click.Path(dir_okay=False, writable=True, resolve_path=True),
+    help="Stream to this named pipe (created if missing) instead of saving a file.",
 )
 @click.option(
     "-c",
@@ -130,6 +182,35 @@ def validate_url(ctx, param, value: str) -> str:
     type=int,
     help="Socket timeout in seconds (default: 30).",
 )
+@click.option(
+    "--queue",
+    "queue_dir",
+    type=click.Path(file_okay=False, dir_okay=True, resolve_path=True),
+    help="Shared queue directory. With URLs, enqueue them; without, run as a worker.",
+)
+@click.option(
+    "--lease-seconds",
+    default=DEFAULT_LEASE_SECONDS,
+    type=float,
+    help=f"Seconds before a dead worker's job is reclaimed (default: {DEFAULT_LEASE_SECONDS:g}).",
+)
+@click.option(
+    "--prefetch",
+    default=DEFAULT_PREFETCH,
+    type=click.IntRange(min=1),
+    help=f"With several URLs, resolve this many ahead while one downloads (default: {DEFAULT_PREFETCH}).",
+)
+@click.option(
+    "--trace",
+    "trace_path",
+    type=click.Path(file_okay=True, dir_okay=False, writable=True, resolve_path=True),
+    help="Write a Chrome/Perfetto trace timeline of the download to this file.",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="With --trace, also write cProfile stats (all Python threads) to <trace>.prof.",
+)
 @click.option(
     "-v",
     "--verbose",
@@ -137,9 +218,10 @@ def validate_url(ctx, param, value: str) -> str:
     help="Enable verbose logging.",
 )
 def main(
-    url: str,
+    urls: Tuple[str, ...],
     download_format: str,
     output_path: str,
+    pipe_path: Optional[str],
     cookies_path: Optional[str],
     username: Optional[str],
     password: Optional[str],
@@ -149,6 +231,11 @@ def main(
     audio_quality: str,
     retries: int,
     timeout: int,
+    queue_dir: Optional[str],
+    lease_seconds: float,
+    prefetch: int,
+    trace_path: Optional[str],
+    profile: bool,
     verbose: bool,
 ) -> None:
     """
@@ -173,12 +260,41 @@ def main(
 
         # Download without any authentication
         video-download --no-cookies "https://www.youtube.com/watch?v=example"
+
+        # Share work between hosts: enqueue once, then start a worker per host
+        video-download --queue /mnt/share/queue URL1 URL2 URL3
+        video-download --queue /mnt/share/queue -o /mnt/share/media
+
+        # Stream straight into another program
+        video-download -f audio -o - "https://example.com/video" | ffplay -
     """
+    stream_target = "-" if output_path == "-" else pipe_path
+
+    # Keep stdout clean for the media stream
+    if stream_target == "-":
+        console.stderr = True
+
     # Set logging level
     if verbose:
         logging.getLogger().setLevel(logging.DEBUG)
         logger.debug("Verbose logging enabled")
 
+    if not urls and not queue_dir:
+        console.print("[red]Error: at least one URL is required unless --queue is given[/red]")
+        sys.exit(1)
+
+    if stream_target:
+        if output_path == "-" and pipe_path:
+            console.print("[red]Error: use either '-o -' or --pipe, not both[/red]")
+            sys.exit(1)
+        if len(urls) != 1 or queue_dir:
+            console.print("[red]Error: streaming takes exactly one URL and no --queue[/red]")
+            sys.exit(1)
+
+    if profile and not trace_path:
+        console.print("[red]Error: --profile requires --trace[/red]")
+        sys.exit(1)
+
     # Validate authentication options
     if username and not password:
         console.print("[red]Error: --password is required when using --username[/red]")
@@ -198,9 +314,23 @@ def main(
     # Convert format to boolean
     is_audio = download_format.lower() == "audio"
 
+    if queue_dir and urls:
+        try:
+            queue = WorkQueue(Path(queue_dir), lease_seconds=lease_seconds)
+            for url in urls:
+                queue.enqueue(url, is_audio=is_audio)
+        except QueueError as e:
+            console.print(f"[red]Queue Error:[/red] {e}")
+            sys.exit(7)
+        console.print(f"[green]✓ Queued {len(urls)} job(s) in {queue_dir}[/green]")
+        return
+
     # Display configuration
     logger.info(f"Download format: {download_format}")
-    logger.info(f"Output directory: {output_path}")
+    if stream_target:
+        logger.info(f"Streaming to: {'stdout' if stream_target == '-' else stream_target}")
+    else:
+        logger.info(f"Output directory: {output_path}")
 
     if username:
         logger.info("Authentication: username/password")
@@ -211,25 +341,74 @@ def main(
     elif no_cookies:
         logger.info("Authentication: none (public content only)")
 
+    tracer = Tracer(profile=profile) if trace_path else None
+
     # Execute download
-    with Progress() as progress:
+    with Progress(console=console) as progress:
         try:
-            downloader = Downloader(progress)
-            downloader.download(
-                url=url,
-                download_path=output_path,
-                is_audio=is_audio,
-                cookies_path=cookies_path,
-                username=username,
-                password=password,
-                site=site,
-                audio_quality=audio_quality,
-                verify_ssl=not no_check_certificate,
-                max_retries=retries,
-                timeout=timeout,
-                use_cookies=not no_cookies,
-            )
-            console.print("[green]✓ Download completed successfully![/green]")
+            downloader = Downloader(progress, tracer=tracer)
+
+            def fetch(url: str, audio: bool) -> None:
+                downloader.download(
+                    url=url,
+                    download_path=output_path,
+                    is_audio=audio,
+                    cookies_path=cookies_path,
+                    username=username,
+                    password=password,
+                    site=site,
+                    audio_quality=audio_quality,
+                    verify_ssl=not no_check_certificate,
+                    max_retries=retries,
+                    timeout=timeout,
+                    use_cookies=not no_cookies,
+                )
+
+            if stream_target:
+                downloader.stream(
+                    url=urls[0],
+                    target=stream_target,
+                    is_audio=is_audio,
+                    cookies_path=cookies_path,
+                    username=username,
+                    password=password,
+                    site=site,
+                    audio_quality=audio_quality,
+                    verify_ssl=not no_check_certificate,
+                    max_retries=retries,
+                    timeout=timeout,
+                    use_cookies=not no_cookies,
+                )
+                console.print("[green]✓ Stream completed successfully![/green]")
+            elif queue_dir:
+                queue = WorkQueue(Path(queue_dir), lease_seconds=lease_seconds)
+                logger.info(f"Worker {queue.worker_id} pulling jobs from: {queue_dir}")
+                completed = run_worker(queue, lambda job: fetch(job.url, job.is_audio))
+                console.print(f"[green]✓ Queue drained, {completed} job(s) completed by this worker[/green]")
+            elif len(urls) > 1:
+                runner = PipelinedRunner(downloader, prefetch=prefetch)
+                completed = runner.run(
+                    urls,
+                    site=site,
+                    username=username,
+                    password=password,
+                    download_path=output_path,
+                    is_audio=is_audio,
+                    cookies_path=cookies_path,
+                    audio_quality=audio_quality,
+                    verify_ssl=not no_check_certificate,
+                    max_retries=retries,
+                    timeout=timeout,
+                    use_cookies=not no_cookies,
+                )
+                console.print(f"[green]✓ {completed} downloads completed successfully![/green]")
+            else:
+                fetch(urls[0], is_audio)
+                console.print("[green]✓ Download completed successfully![/green]")
+
+        except QueueError as e:
+            console.print(f"[red]Queue Error:[/red] {e}")
+            sys.exit(7)
 
         except DependencyError as e:
             console.print(f"[red]Dependency Error:[/red] {e}")
@@ -267,6 +446,11 @@ def main(
                 console.print_exception()
             sys.exit(1)
 
+        finally:
+            # Failed and interrupted downloads are the ones worth inspecting
+            if tracer is not None:
+                tracer.save(trace_path)
+
 
 if __name__ == "__main__":
     main()
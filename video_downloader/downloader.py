@@ -8,6 +8,7 @@ error handling, and configurable options.
 import os
 import logging
 import shutil
+from contextlib import nullcontext
 from typing import Optional, Dict, Any
 from pathlib import Path
 
@@ -15,6 +16,8 @@ import yt_dlp
 from rich.progress import Progress
 
 from .auth import get_auth_options
+from .stream import StreamPump, build_ffmpeg_command
+from .trace import Tracer
 from .exceptions import (
     DownloadError,
     NetworkError,
@@ -25,17 +28,35 @@ from .exceptions import (
 logger = logging.getLogger(__name__)
 
 
+class _RetryableLogger:
+    """yt-dlp logger that reports errors as warnings, for attempts the caller may retry."""
+
+    def debug(self, msg: str) -> None:
+        logger.debug(msg)
+
+    def info(self, msg: str) -> None:
+        logger.info(msg)
+
+    def warning(self, msg: str) -> None:
+        logger.warning(msg)
+
+    def error(self, msg: str) -> None:
+        logger.warning(msg)
+
+
 class Downloader:
     """Handles video and audio downloads with progress tracking."""
 
-    def __init__(self, progress: Progress):
+    def __init__(self, progress: Progress, tracer: Optional[Tracer] = None):
         """
         Initialize downloader.
 
         Args:
             progress: Rich Progress instance for UI feedback
+            tracer: Optional Tracer recording a timeline of each download
         """
         self.progress = progress
+        self.tracer = tracer
         self.task_id = None
         self._verify_dependencies()
 
@@ -54,6 +75,12 @@ class Downloader:
                 "  Gentoo: sudo emerge media-video/ffmpeg"
             )
 
+    def _span(self, name: str, **args: Any):
+        """Return a tracing span context, or a no-op one when not tracing."""
+        if self.tracer is None:
+            return nullcontext()
+        return self.tracer.span(name, **args)
+
     def _hook(self, d: Dict[str, Any]) -> None:
         """
         Progress hook for yt-dlp downloads.
@@ -99,6 +126,72 @@ class Downloader:
                     description="[red]Download failed!",
                 )
 
+    def extract(
+        self,
+        url: str,
+        download_path: str,
+        is_audio: bool = False,
+        cookies_path: Optional[str] = None,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        site: Optional[str] = None,
+        audio_quality: str = "192",
+        verify_ssl: bool = True,
+        max_retries: int = 3,
+        timeout: int = 30,
+        use_cookies: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Resolve the info dict for a URL without downloading anything.
+
+        Safe to call from a background thread while another download runs;
+        the result can be passed to download() via its info argument.
+
+        Args:
+            url: Video/audio URL to resolve
+            download_path: Destination directory (used for output template)
+            is_audio: Whether to select audio-only formats
+            cookies_path: Path to browser cookies file (optional)
+            username: Direct username for authentication (overrides stored)
+            password: Direct password for authentication (overrides stored)
+            site: Site identifier for stored credentials
+            audio_quality: Audio bitrate in kbps (default: 192)
+            verify_ssl: Whether to verify SSL certificates (default: True)
+            max_retries: Maximum number of retry attempts (default: 3)
+            timeout: Socket timeout in seconds (default: 30)
+            use_cookies: Whether to use cookies at all (default: True)
+
+        Returns:
+            yt-dlp info dict with formats selected
+
+        Raises:
+            DownloadError: If extraction fails
+            NetworkError: If network-related error occurs
+            FormatError: If requested format is not available
+        """
+        ydl_opts = self._build_options(
+            download_path, is_audio, audio_quality, verify_ssl, max_retries, timeout
+        )
+        self._apply_auth(ydl_opts, cookies_path, username, password, site, use_cookies)
+
+        try:
+            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                if self.tracer is not None:
+                    self.tracer.instrument(ydl)
+
+                logger.debug(f"Extracting info for: {url}")
+                with self._span("extract", url=url):
+                    return ydl.extract_info(url, download=False)
+
+        except yt_dlp.utils.DownloadError as e:
+            error_msg = str(e)
+            logger.error(f"Extraction failed: {error_msg}")
+            raise self._categorize_error(error_msg) from e
+
+        except Exception as e:
+            logger.error(f"Unexpected error: {e}")
+            raise DownloadError(f"Unexpected error: {e}") from e
+
     def download(
         self,
         url: str,
@@ -113,6 +206,8 @@ class Downloader:
         max_retries: int = 3,
         timeout: int = 30,
         use_cookies: bool = True,
+        info: Optional[Dict[str, Any]] = None,
+        log_errors: bool = True,
     ) -> None:
         """
         Execute download using yt-dlp.
@@ -130,20 +225,184 @@ class Downloader:
             max_retries: Maximum number of retry attempts (default: 3)
             timeout: Socket timeout in seconds (default: 30)
             use_cookies: Whether to use cookies at all (default: True)
+            info: Info dict already resolved by extract() (skips extraction)
+            log_errors: Whether failures are logged as errors; callers that retry
+                pass False to have them reported as warnings instead
 
         Raises:
             DownloadError: If download fails
             NetworkError: If network-related error occurs
             FormatError: If requested format is not available
         """
+        # Start a fresh progress task for each download on a reused instance
+        self.task_id = None
+
         # Ensure download path exists
         Path(download_path).mkdir(parents=True, exist_ok=True)
 
-        # Build yt-dlp options
+        ydl_opts = self._build_options(
+            download_path, is_audio, audio_quality, verify_ssl, max_retries, timeout
+        )
+        ydl_opts["progress_hooks"] = [self._hook]
+        if not log_errors:
+            ydl_opts["logger"] = _RetryableLogger()
+        self._apply_auth(ydl_opts, cookies_path, username, password, site, use_cookies)
+
+        if self.tracer is not None:
+            ydl_opts["progress_hooks"].append(self.tracer.progress_hook)
+            ydl_opts["postprocessor_hooks"] = [self.tracer.postprocessor_hook]
+
+        # Execute download
+        try:
+            with self._span("job", url=url), yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                if self.tracer is not None:
+                    self.tracer.instrument(ydl)
+
+                logger.info(f"Starting download from: {url}")
+                with self._span("download", url=url):
+                    if info is None:
+                        ydl.download([url])
+                    else:
+                        # Reuse info resolved ahead of time by extract()
+                        ydl.process_ie_result(info, download=True)
+                logger.info("Download completed successfully")
+
+        except yt_dlp.utils.DownloadError as e:
+            error_msg = str(e)
+            logger.log(logging.ERROR if log_errors else logging.WARNING, f"Download failed: {error_msg}")
+            raise self._categorize_error(error_msg) from e
+
+        except Exception as e:
+            logger.log(logging.ERROR if log_errors else logging.WARNING, f"Unexpected error: {e}")
+            raise DownloadError(f"Unexpected error: {e}") from e
+
+    def stream(
+        self,
+        url: str,
+        target: str,
+        is_audio: bool = False,
+        cookies_path: Optional[str] = None,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        site: Optional[str] = None,
+        audio_quality: str = "192",
+        verify_ssl: bool = True,
+        max_retries: int = 3,
+        timeout: int = 30,
+        use_cookies: bool = True,
+    ) -> None:
+        """
+        Stream media to stdout or a named pipe without writing it to disk.
+
+        A single pre-muxed format is selected and remuxed by ffmpeg into a
+        pipe-friendly container; audio is transcoded to MP3 on the fly.
+
+        Args:
+            url: Video/audio URL to stream
+            target: "-" for stdout, otherwise a FIFO (created if missing) or file path
+            is_audio: Whether to stream audio only
+            cookies_path: Path to browser cookies file (optional)
+            username: Direct username for authentication (overrides stored)
+            password: Direct password for authentication (overrides stored)
+            site: Site identifier for stored credentials
+            audio_quality: Audio bitrate in kbps (default: 192)
+            verify_ssl: Whether to verify SSL certificates (default: True)
+            max_retries: Retry attempts for extraction; above zero also enables
+                ffmpeg reconnection during the transfer (default: 3)
+            timeout: Socket timeout in seconds (default: 30)
+            use_cookies: Whether to use cookies at all (default: True)
+
+        Raises:
+            DownloadError: If streaming fails
+            NetworkError: If network-related error occurs
+            FormatError: If no single-file format is available
+        """
+        self.task_id = None
+
+        ydl_opts = {
+            "format": self._get_stream_format_string(is_audio),
+            "retries": max_retries,
+            "extractor_retries": max_retries,
+            "socket_timeout": timeout,
+            "nocheckcertificate": not verify_ssl,
+            "noplaylist": True,
+            "quiet": True,
+            "no_warnings": False,
+        }
+        self._apply_auth(ydl_opts, cookies_path, username, password, site, use_cookies)
+
+        try:
+            with self._span("job", url=url, target=target), yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                if self.tracer is not None:
+                    self.tracer.instrument(ydl)
+
+                logger.info(f"Resolving stream for: {url}")
+                with self._span("extract", url=url):
+                    info = ydl.extract_info(url, download=False)
+
+                if info.get("requested_formats") or not info.get("url"):
+                    raise FormatError("No single pre-muxed format is available to stream")
+
+                hooks = [self._hook]
+                if self.tracer is not None:
+                    hooks.append(self.tracer.progress_hook)
+
+                pump = StreamPump(
+                    build_ffmpeg_command(
+                        info,
+                        is_audio,
+                        audio_quality,
+                        timeout,
+                        cookies=ydl.cookiejar.get_cookies_for_url(info["url"]),
+                        verify_ssl=verify_ssl,
+                        max_retries=max_retries,
+                    ),
+                    target,
+                    hooks,
+                )
+                logger.info(f"Streaming {info.get('format_id')} to: {target}")
+                with self._span("stream", url=url, target=target):
+                    pump.run()
+                logger.info("Stream completed successfully")
+
+        except yt_dlp.utils.DownloadError as e:
+            error_msg = str(e)
+            logger.error(f"Stream failed: {error_msg}")
+            raise self._categorize_error(error_msg) from e
+
+        except DownloadError:
+            raise
+
+        except Exception as e:
+            logger.error(f"Unexpected error: {e}")
+            raise DownloadError(f"Unexpected error: {e}") from e
+
+    def _build_options(
+        self,
+        download_path: str,
+        is_audio: bool,
+        audio_quality: str,
+        verify_ssl: bool,
+        max_retries: int,
+        timeout: int,
+    ) -> Dict[str, Any]:
+        """
+        Build yt-dlp options shared by extraction and download.
+
+        Args:
+            download_path: Destination directory
+            is_audio: Whether to extract audio only
+            audio_quality: Audio bitrate in kbps
+            verify_ssl: Whether to verify SSL certificates
+            max_retries: Maximum number of retry attempts
+            timeout: Socket timeout in seconds
+
+        Returns:
+            yt-dlp options dictionary (without authentication)
+        """
         ydl_opts = {
             "format": self._get_format_string(is_audio),
             "outtmpl": os.path.join(download_path, "%(title)s.%(ext)s"),
-            "progress_hooks": [self._hook],
             "retries": max_retries,
             "socket_timeout": timeout,
             "nocheckcertificate": not verify_ssl,  # Only disable if explicitly requested
@@ -162,6 +421,28 @@ class Downloader:
                 }
             ]
 
+        return ydl_opts
+
+    @staticmethod
+    def _apply_auth(
+        ydl_opts: Dict[str, Any],
+        cookies_path: Optional[str],
+        username: Optional[str],
+        password: Optional[str],
+        site: Optional[str],
+        use_cookies: bool,
+    ) -> None:
+        """
+        Add authentication options to yt-dlp options in priority order.
+
+        Args:
+            ydl_opts: yt-dlp options dictionary to update in place
+            cookies_path: Path to browser cookies file (optional)
+            username: Direct username for authentication
+            password: Direct password for authentication
+            site: Site identifier for stored credentials
+            use_cookies: Whether to use cookies at all
+        """
         # Authentication: prioritize non-cookie methods
         if username and password:
             # Direct credentials (highest priority)
@@ -179,28 +460,39 @@ class Downloader:
         elif not use_cookies:
             logger.info("Running without authentication (no-cookie mode)")
 
-        # Execute download
-        try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                logger.info(f"Starting download from: {url}")
-                ydl.download([url])
-                logger.info("Download completed successfully")
+    @staticmethod
+    def _categorize_error(error_msg: str) -> DownloadError:
+        """
+        Categorize a yt-dlp error message for better user feedback.
 
-        except yt_dlp.utils.DownloadError as e:
-            error_msg = str(e)
-            logger.error(f"Download failed: {error_msg}")
+        Args:
+            error_msg: Error message reported by yt-dlp
 
-            # Categorize errors for better user feedback
-            if "network" in error_msg.lower() or "connection" in error_msg.lower():
-                raise NetworkError(f"Network error: {error_msg}") from e
-            elif "format" in error_msg.lower() or "video" in error_msg.lower():
-                raise FormatError(f"Format error: {error_msg}") from e
-            else:
-                raise DownloadError(f"Download failed: {error_msg}") from e
+        Returns:
+            The matching DownloadError subclass instance
+        """
+        if "network" in error_msg.lower() or "connection" in error_msg.lower():
+            return NetworkError(f"Network error: {error_msg}")
+        elif "format" in error_msg.lower() or "video" in error_msg.lower():
+            return FormatError(f"Format error: {error_msg}")
+        else:
+            return DownloadError(f"Download failed: {error_msg}")
 
-        except Exception as e:
-            logger.error(f"Unexpected error: {e}")
-            raise DownloadError(f"Unexpected error: {e}") from e
+    @staticmethod
+    def _get_stream_format_string(is_audio: bool) -> str:
+        """
+        Get format string selecting a single file that needs no merging.
+
+        Args:
+            is_audio: Whether streaming audio only
+
+        Returns:
+            yt-dlp format string
+        """
+        if is_audio:
+            return "bestaudio/best"
+        else:
+            return "best[ext=mp4]/best"
 
     @staticmethod
     def _get_format_string(is_audio: bool) -> str:
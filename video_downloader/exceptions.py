@@ -38,3 +38,8 @@ class AuthenticationError(VideoDownloaderError):
 class ValidationError(VideoDownloaderError):
     """Raised when input validation fails."""
     pass
+
+
+class QueueError(VideoDownloaderError):
+    """Raised when the shared work queue is unusable or corrupted."""
+    pass
@@ -0,0 +1,257 @@
+"""
+Pipelined download runner for video-downloader.
+
+Overlaps extraction with transfer: while one URL downloads, the info dicts
+for the next few queued URLs are resolved in background threads, so the
+link is not idle during multi-second extractions. Resolved info whose
+signed media URLs have expired (or are about to) is re-resolved before use.
+"""
+
+import re
+import time
+import queue
+import logging
+import threading
+from collections import deque
+from concurrent.futures import Future
+from datetime import datetime, timezone
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from .auth import get_auth_options
+from .downloader import Downloader
+from .exceptions import DownloadError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PREFETCH = 2
+
+# Re-resolve signed URLs expiring within this many seconds
+EXPIRY_MARGIN = 120.0
+
+# Re-resolve info older than this when the URL carries no expiry hint
+DEFAULT_MAX_INFO_AGE = 1800.0
+
+# Query parameters carrying a Unix expiry timestamp on common CDNs
+_EXPIRY_PARAMS = ("expire", "expires", "Expires", "exp")
+
+# Path-style expiry used by some manifest URLs, e.g. /expire/1700000000/
+_EXPIRY_PATH = re.compile(r"/expire/(\d+)(?:/|$)")
+
+
+def signed_url_expiry(info: Dict[str, Any]) -> Optional[float]:
+    """
+    Find the earliest expiry time among the media URLs of an info dict.
+
+    Args:
+        info: yt-dlp info dict (single video or playlist)
+
+    Returns:
+        Unix timestamp of the earliest expiry, or None if no URL carries one
+    """
+    if info.get("entries"):
+        expiries = [signed_url_expiry(entry) for entry in info["entries"] if entry]
+    else:
+        formats = info.get("requested_formats") or [info]
+        expiries = [_url_expiry(fmt["url"]) for fmt in formats if fmt.get("url")]
+
+    expiries = [expiry for expiry in expiries if expiry is not None]
+    return min(expiries) if expiries else None
+
+
+def _url_expiry(url: str) -> Optional[float]:
+    """Extract an expiry timestamp from a signed URL, if present."""
+    parsed = urlparse(url)
+    query = parse_qs(parsed.query)
+
+    for key in _EXPIRY_PARAMS:
+        if key in query:
+            try:
+                return float(query[key][0])
+            except ValueError:
+                continue
+
+    # AWS SigV4 presigned URLs: signing time plus lifetime in seconds
+    if "X-Amz-Date" in query and "X-Amz-Expires" in query:
+        try:
+            signed = datetime.strptime(query["X-Amz-Date"][0], "%Y%m%dT%H%M%SZ")
+            signed = signed.replace(tzinfo=timezone.utc)
+            return signed.timestamp() + float(query["X-Amz-Expires"][0])
+        except ValueError:
+            pass
+
+    match = _EXPIRY_PATH.search(parsed.path)
+    if match:
+        return float(match.group(1))
+
+    return None
+
+
+class _PrefetchPool:
+    """
+    Minimal thread pool whose workers are daemon threads.
+
+    ThreadPoolExecutor joins its workers at interpreter exit, so a failed run
+    would still wait for every extraction in flight before the process ends.
+    """
+
+    def __init__(self, workers: int):
+        self._tasks: "queue.Queue[Optional[Tuple[Future, Callable[..., Any], Tuple[Any, ...]]]]" = queue.Queue()
+        self._threads: List[threading.Thread] = []
+        for index in range(workers):
+            thread = threading.Thread(target=self._work, name=f"prefetch_{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """Schedule fn(*args) and return a future for its result."""
+        future: Future = Future()
+        self._tasks.put((future, fn, args))
+        return future
+
+    def shutdown(self) -> None:
+        """Stop the workers once they finish their current task, without waiting."""
+        for _ in self._threads:
+            self._tasks.put(None)
+
+    def _work(self) -> None:
+        """Run queued tasks until a stop sentinel arrives."""
+        while True:
+            task = self._tasks.get()
+            if task is None:
+                return
+            future, fn, args = task
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+
+class PipelinedRunner:
+    """Downloads URLs in order while prefetching info for the ones queued behind."""
+
+    def __init__(
+        self,
+        downloader: Downloader,
+        prefetch: int = DEFAULT_PREFETCH,
+        max_info_age: float = DEFAULT_MAX_INFO_AGE,
+    ):
+        """
+        Initialize pipelined runner.
+
+        Args:
+            downloader: Downloader performing extraction and transfers
+            prefetch: Number of upcoming URLs to resolve while one downloads
+            max_info_age: Seconds after which info without an expiry hint is re-resolved
+        """
+        self.downloader = downloader
+        self.prefetch = max(prefetch, 1)
+        self.max_info_age = max_info_age
+
+    def run(
+        self,
+        urls: Iterable[str],
+        site: Optional[str] = None,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        **options: Any,
+    ) -> int:
+        """
+        Download every URL, stopping at the first failure.
+
+        Args:
+            urls: URLs to download, in order
+            site: Site identifier for stored credentials
+            username: Direct username for authentication (overrides stored)
+            password: Direct password for authentication (overrides stored)
+            **options: Remaining Downloader.download() keyword arguments
+
+        Returns:
+            Number of URLs downloaded
+
+        Raises:
+            DownloadError: If extraction or download of any URL fails
+        """
+        # Same priority as a single download: direct credentials, then site, then cookies
+        options.update(site=site, username=username, password=password)
+        if site and not (username and password):
+            # Check stored credentials once up front instead of per job
+            auth = get_auth_options(site=site)
+            if auth:
+                options.update(auth)
+            else:
+                logger.warning(f"No stored credentials found for site: {site}")
+
+        pending: Deque[Tuple[str, "Future[Tuple[Dict[str, Any], float]]"]] = deque()
+        remaining = iter(urls)
+        completed = 0
+
+        pool = _PrefetchPool(self.prefetch)
+        try:
+            while True:
+                # Keep the current job plus `prefetch` upcoming ones resolving
+                while len(pending) < self.prefetch + 1:
+                    url = next(remaining, None)
+                    if url is None:
+                        break
+                    pending.append((url, pool.submit(self._resolve, url, options)))
+
+                if not pending:
+                    return completed
+
+                url, future = pending.popleft()
+                info, resolved_at = future.result()
+                self._download(url, info, resolved_at, options)
+                completed += 1
+        finally:
+            # Drop queued extractions; running ones are abandoned to their daemon threads
+            for _, future in pending:
+                future.cancel()
+            pool.shutdown()
+
+    def _resolve(self, url: str, options: Dict[str, Any]) -> Tuple[Dict[str, Any], float]:
+        """Extract info for a URL and note when it was resolved."""
+        info = self.downloader.extract(url, **options)
+        return info, time.time()
+
+    def _download(
+        self,
+        url: str,
+        info: Dict[str, Any],
+        resolved_at: float,
+        options: Dict[str, Any],
+    ) -> None:
+        """Download prefetched info, re-resolving it if its URLs went stale."""
+        if self._is_stale(info, resolved_at):
+            # Let download() extract again right before the transfer
+            logger.info(f"Prefetched media URLs expired, re-resolving: {url}")
+            self.downloader.download(url, **options)
+            return
+
+        try:
+            # Failures here may be retried, so they are not logged as errors yet
+            self.downloader.download(url, info=info, log_errors=False, **options)
+        except DownloadError as e:
+            # The CDN may reject a signed URL before its advertised expiry
+            if not self._is_expired_error(e):
+                logger.error(str(e))
+                raise
+            logger.warning(f"Prefetched media URLs rejected ({e}), re-resolving: {url}")
+            self.downloader.download(url, **options)
+
+    def _is_stale(self, info: Dict[str, Any], resolved_at: float) -> bool:
+        """Check whether prefetched info must be resolved again before use."""
+        expiry = signed_url_expiry(info)
+        if expiry is not None:
+            return expiry - time.time() < EXPIRY_MARGIN
+        return time.time() - resolved_at > self.max_info_age
+
+    @staticmethod
+    def _is_expired_error(error: DownloadError) -> bool:
+        """Check whether a download error looks like a rejected signed URL."""
+        message = str(error).lower()
+        return any(hint in message for hint in ("403", "410", "forbidden", "expired"))
@@ -0,0 +1,252 @@
+"""
+Streaming module for video-downloader.
+
+Delivers media as a byte stream to stdout or a named pipe without writing
+it to disk. ffmpeg reads the resolved media URL and remuxes (or, for audio,
+transcodes) it into a pipe-friendly container; its output passes through a
+bounded in-memory buffer so a slow consumer applies backpressure all the
+way back to the network connection.
+"""
+
+import os
+import sys
+import stat
+import time
+import queue
+import logging
+import tempfile
+import threading
+import subprocess
+from http.cookiejar import Cookie
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .exceptions import DownloadError
+
+logger = logging.getLogger(__name__)
+
+# Bytes read from ffmpeg per chunk
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Chunks held in memory before ffmpeg is made to wait (4 MiB)
+STREAM_BUFFER_CHUNKS = 64
+
+
+def build_ffmpeg_command(
+    info: Dict[str, Any],
+    is_audio: bool,
+    audio_quality: str,
+    timeout: int,
+    cookies: Sequence[Cookie] = (),
+    verify_ssl: bool = True,
+    max_retries: int = 3,
+) -> List[str]:
+    """
+    Build the ffmpeg command that writes a resolved format to stdout.
+
+    Args:
+        info: yt-dlp info dict with a single selected format
+        is_audio: Whether to transcode to MP3 audio
+        audio_quality: Audio bitrate in kbps
+        timeout: Socket timeout in seconds
+        cookies: Cookies yt-dlp holds for the media URL
+        verify_ssl: Whether ffmpeg must verify TLS certificates
+        max_retries: Enables ffmpeg's HTTP reconnection when above zero
+            (ffmpeg bounds reconnection by delay, not by attempt count)
+
+    Returns:
+        ffmpeg argument list
+    """
+    command = ["ffmpeg", "-hide_banner", "-nostdin", "-loglevel", "error"]
+
+    # HTTP-level options, only valid when ffmpeg opens the URL over http(s)
+    if info["url"].startswith(("http://", "https://")):
+        # Since 2023.07.06 yt-dlp keeps cookies out of http_headers, so pass them
+        # like its FFmpegFD does
+        if cookies:
+            cookie_lines = "".join(
+                f"{cookie.name}={cookie.value}; path={cookie.path}; domain={cookie.domain};\r\n"
+                for cookie in cookies
+            )
+            command += ["-cookies", cookie_lines]
+
+        headers = info.get("http_headers") or {}
+        if headers:
+            command += ["-headers", "".join(f"{key}: {value}\r\n" for key, value in headers.items())]
+
+        # ffmpeg does not verify certificates unless asked to; the option is
+        # rejected as unused when the input is plain http
+        if info["url"].startswith("https://"):
+            command += ["-tls_verify", "1" if verify_ssl else "0"]
+
+        if max_retries > 0:
+            command += ["-reconnect", "1", "-reconnect_streamed", "1"]
+
+    command += ["-rw_timeout", str(timeout * 1_000_000), "-i", info["url"]]
+
+    if is_audio:
+        command += ["-vn", "-c:a", "libmp3lame", "-b:a", f"{audio_quality}k", "-f", "mp3"]
+    elif info.get("ext") == "mp4":
+        # Fragmented MP4 can be written without seeking back to the header
+        command += ["-c", "copy", "-movflags", "frag_keyframe+empty_moov", "-f", "mp4"]
+    else:
+        command += ["-c", "copy", "-f", "matroska"]
+
+    command.append("pipe:1")
+    return command
+
+
+class StreamPump:
+    """Copies ffmpeg output to a sink through a bounded buffer."""
+
+    def __init__(
+        self,
+        command: List[str],
+        target: str,
+        hooks: List[Callable[[Dict[str, Any]], None]],
+        buffer_chunks: int = STREAM_BUFFER_CHUNKS,
+    ):
+        """
+        Initialize stream pump.
+
+        Args:
+            command: ffmpeg command writing media to its stdout
+            target: "-" for stdout, otherwise a FIFO (created if missing) or file path
+            hooks: Progress hooks receiving yt-dlp style status dictionaries
+            buffer_chunks: Maximum number of chunks buffered in memory
+        """
+        self.command = command
+        self.target = target
+        self.hooks = hooks
+        self.buffer_chunks = buffer_chunks
+
+    def run(self) -> int:
+        """
+        Run ffmpeg and stream its output until it finishes.
+
+        Returns:
+            Number of bytes delivered to the sink
+
+        Raises:
+            DownloadError: If ffmpeg fails or the consumer closes the pipe early
+        """
+        sink, owned = self._open_sink()
+        buffer: "queue.Queue[Optional[bytes]]" = queue.Queue(maxsize=self.buffer_chunks)
+        stop = threading.Event()
+        written = 0
+        start = time.monotonic()
+
+        with tempfile.TemporaryFile() as stderr:
+            logger.debug(f"Running: {' '.join(self.command)}")
+            process = subprocess.Popen(
+                self.command,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=stderr,
+            )
+            reader = threading.Thread(
+                target=self._read,
+                args=(process.stdout, buffer, stop),
+                daemon=True,
+            )
+            reader.start()
+
+            try:
+                while True:
+                    chunk = buffer.get()
+                    if chunk is None:
+                        break
+                    self._write(sink, chunk)
+                    written += len(chunk)
+                    self._report("downloading", written, start)
+            except BaseException:
+                self._report("error", written, start)
+                process.kill()
+                raise
+            finally:
+                stop.set()
+                returncode = process.wait()
+                reader.join()
+                process.stdout.close()
+                if owned:
+                    try:
+                        sink.close()
+                    except BrokenPipeError:
+                        pass
+
+            if returncode != 0:
+                self._report("error", written, start)
+                stderr.seek(0)
+                message = stderr.read().decode(errors="replace").strip().splitlines()
+                detail = message[-1] if message else "no output"
+                raise DownloadError(f"ffmpeg exited with code {returncode}: {detail}")
+
+        self._report("finished", written, start)
+        return written
+
+    def _open_sink(self) -> Tuple[BinaryIO, bool]:
+        """
+        Open the output for writing.
+
+        Returns:
+            The writable binary stream and whether this pump owns (closes) it
+        """
+        if self.target == "-":
+            return sys.stdout.buffer, False
+
+        if not os.path.exists(self.target):
+            os.mkfifo(self.target, 0o600)
+            logger.info(f"Created named pipe: {self.target}")
+
+        if stat.S_ISFIFO(os.stat(self.target).st_mode):
+            # Opening a FIFO blocks until a consumer opens the other end
+            logger.info(f"Waiting for a reader on: {self.target}")
+
+        return open(self.target, "wb"), True
+
+    def _write(self, sink: BinaryIO, chunk: bytes) -> None:
+        """Write a chunk, translating a closed consumer into a DownloadError."""
+        try:
+            sink.write(chunk)
+            sink.flush()
+        except BrokenPipeError as e:
+            if sink is sys.stdout.buffer:
+                # Keep the interpreter from failing again when it flushes stdout on exit
+                devnull = os.open(os.devnull, os.O_WRONLY)
+                os.dup2(devnull, sys.stdout.fileno())
+            raise DownloadError("Stream consumer closed the pipe before the stream ended") from e
+
+    @staticmethod
+    def _read(stdout: BinaryIO, buffer: "queue.Queue[Optional[bytes]]", stop: threading.Event) -> None:
+        """Read ffmpeg output into the buffer, blocking while it is full."""
+
+        def put(item: Optional[bytes]) -> bool:
+            while not stop.is_set():
+                try:
+                    buffer.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        try:
+            while True:
+                # read1 returns as soon as any data is available, keeping latency low
+                chunk = stdout.read1(STREAM_CHUNK_SIZE)
+                if not chunk or not put(chunk):
+                    break
+        finally:
+            put(None)
+
+    def _report(self, status: str, written: int, start: float) -> None:
+        """Send a progress update to every hook."""
+        elapsed = time.monotonic() - start
+        d = {
+            "status": status,
+            "filename": self.target,
+            "downloaded_bytes": written,
+            "total_bytes": None,
+            "elapsed": elapsed,
+            "speed": written / elapsed if elapsed > 0 else None,
+        }
+        for hook in self.hooks:
+            hook(d)
@@ -0,0 +1,302 @@
+"""
+Tracing module for video-downloader.
+
+Records timestamped spans for each download phase (extraction HTTP calls,
+transfers, fragments, postprocessors) from yt-dlp's progress and
+postprocessor hooks, and writes them in Chrome trace format for viewing
+in chrome://tracing or https://ui.perfetto.dev. Optionally profiles the
+Python side with cProfile.
+"""
+
+import os
+import sys
+import json
+import time
+import pstats
+import logging
+import cProfile
+import threading
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, List, Tuple, Iterator
+
+logger = logging.getLogger(__name__)
+
+# Number of hottest functions summarized inside the trace file
+PROFILE_SUMMARY_SIZE = 25
+
+
+class Tracer:
+    """Collects spans and writes them as Chrome/Perfetto trace JSON."""
+
+    def __init__(self, profile: bool = False):
+        """
+        Initialize tracer.
+
+        Args:
+            profile: Whether to run cProfile, in this thread and every thread
+                started afterwards, until the trace is saved
+        """
+        self._origin = time.perf_counter()
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._events: List[Dict[str, Any]] = []
+
+        # Spans opened by one hook call and closed by a later one
+        self._downloads: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._fragments: Dict[Tuple[str, int], Tuple[int, float]] = {}
+        self._postprocessors: Dict[Tuple[str, str], float] = {}
+
+        self._profiler: Optional[cProfile.Profile] = None
+        self._thread_profilers: List[cProfile.Profile] = []
+        if profile:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+            # Fragment downloads and prefetching run in their own threads
+            threading.setprofile(self._profile_thread)
+
+    def _profile_thread(self, frame: Any, event: str, arg: Any) -> None:
+        """Start a profiler in a newly started thread (installed via threading.setprofile)."""
+        sys.setprofile(None)
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Python 3.12+: the main profiler already observes every thread
+            return
+        with self._lock:
+            self._thread_profilers.append(profiler)
+
+    def _now(self) -> float:
+        """Microseconds since the tracer was created."""
+        return (time.perf_counter() - self._origin) * 1_000_000
+
+    def _emit(
+        self,
+        name: str,
+        category: str,
+        start: float,
+        end: float,
+        args: Optional[Dict[str, Any]] = None,
+        tid: Optional[int] = None,
+    ) -> None:
+        """Record a complete ("X") event."""
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": start,
+            "dur": max(end - start, 0),
+            "pid": self._pid,
+            "tid": tid if tid is not None else threading.get_ident(),
+        }
+        if args:
+            event["args"] = args
+        with self._lock:
+            self._events.append(event)
+
+    @contextmanager
+    def span(self, name: str, category: str = "phase", **args: Any) -> Iterator[None]:
+        """
+        Record the enclosed block as a span.
+
+        Args:
+            name: Span name shown in the timeline
+            category: Trace category (e.g. 'phase', 'http')
+            **args: Extra values attached to the span
+        """
+        start = self._now()
+        try:
+            yield
+        except BaseException as e:
+            args["error"] = str(e)
+            raise
+        finally:
+            self._emit(name, category, start, self._now(), args)
+
+    def instrument(self, ydl: Any) -> None:
+        """
+        Trace every HTTP request made through a YoutubeDL instance.
+
+        Args:
+            ydl: yt_dlp.YoutubeDL instance to instrument
+        """
+        urlopen = ydl.urlopen
+
+        def traced_urlopen(req: Any) -> Any:
+            url = req if isinstance(req, str) else getattr(req, "url", None) or req.get_full_url()
+            method = "GET" if isinstance(req, str) else getattr(req, "method", None) or "GET"
+            with self.span(f"HTTP {method}", "http", url=url):
+                return urlopen(req)
+
+        ydl.urlopen = traced_urlopen
+
+    def progress_hook(self, d: Dict[str, Any]) -> None:
+        """
+        Progress hook for yt-dlp that records transfer and fragment spans.
+
+        Args:
+            d: Download status dictionary from yt-dlp
+        """
+        status = d.get("status")
+        filename = d.get("filename") or d.get("tmpfilename") or "<unknown>"
+        now = self._now()
+
+        if status == "downloading":
+            with self._lock:
+                if filename not in self._downloads:
+                    self._downloads[filename] = (now, {"filename": filename})
+                _, args = self._downloads[filename]
+                args["total_bytes"] = d.get("total_bytes") or d.get("total_bytes_estimate")
+                args["downloaded_bytes"] = d.get("downloaded_bytes")
+
+            index = d.get("fragment_index")
+            if index is not None:
+                self._track_fragment(filename, index, d.get("fragment_count"), now)
+
+        elif status in ("finished", "error"):
+            self._close_fragments(filename, now)
+            with self._lock:
+                start, args = self._downloads.pop(filename, (now, {"filename": filename}))
+            if status == "error":
+                args["error"] = True
+            args["elapsed"] = d.get("elapsed")
+            self._emit("transfer", "download", start, now, args)
+
+    def _track_fragment(self, filename: str, index: int, count: Optional[int], now: float) -> None:
+        """Close the previous fragment span of this thread when the index advances."""
+        key = (filename, threading.get_ident())
+        with self._lock:
+            previous = self._fragments.get(key)
+            if previous is not None and previous[0] == index:
+                return
+            self._fragments[key] = (index, now)
+
+        if previous is not None:
+            prev_index, start = previous
+            self._emit(
+                f"fragment {prev_index}",
+                "fragment",
+                start,
+                now,
+                {"filename": filename, "fragment_index": prev_index, "fragment_count": count},
+            )
+
+    def _close_fragments(self, filename: str, now: float) -> None:
+        """Close all open fragment spans for a file."""
+        with self._lock:
+            keys = [key for key in self._fragments if key[0] == filename]
+            open_spans = [(key, self._fragments.pop(key)) for key in keys]
+
+        for (_, tid), (index, start) in open_spans:
+            self._emit(
+                f"fragment {index}",
+                "fragment",
+                start,
+                now,
+                {"filename": filename, "fragment_index": index},
+                tid=tid,
+            )
+
+    def postprocessor_hook(self, d: Dict[str, Any]) -> None:
+        """
+        Postprocessor hook for yt-dlp that records merge and conversion spans.
+
+        Args:
+            d: Postprocessor status dictionary from yt-dlp
+        """
+        status = d.get("status")
+        name = d.get("postprocessor") or "<unknown>"
+        info = d.get("info_dict") or {}
+        key = (name, info.get("id") or "")
+        now = self._now()
+
+        if status == "started":
+            with self._lock:
+                self._postprocessors[key] = now
+        elif status == "finished":
+            with self._lock:
+                start = self._postprocessors.pop(key, now)
+            self._emit(
+                name,
+                "postprocess",
+                start,
+                now,
+                {"filepath": info.get("filepath") or info.get("_filename")},
+            )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Build the trace document.
+
+        Returns:
+            Dictionary in Chrome trace event format
+        """
+        with self._lock:
+            events = list(self._events)
+
+        events.append(
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": self._pid,
+                "args": {"name": "video-downloader"},
+            }
+        )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save(self, path: str) -> None:
+        """
+        Write the trace, and the cProfile stats if profiling, to disk.
+
+        The profile is written next to the trace as PATH.prof (pstats format,
+        viewable with snakeviz or `python -m pstats`).
+
+        Args:
+            path: Destination file for the trace JSON
+        """
+        # Spans still open at save time (e.g. after Ctrl+C) are closed here
+        now = self._now()
+        for filename in list(self._downloads):
+            self.progress_hook({"status": "error", "filename": filename})
+        for (name, _), start in list(self._postprocessors.items()):
+            self._emit(name, "postprocess", start, now, {"incomplete": True})
+        self._postprocessors.clear()
+
+        trace = self.to_dict()
+
+        if self._profiler is not None:
+            threading.setprofile(None)
+            self._profiler.disable()
+            profile_path = f"{path}.prof"
+            self._profile_stats().dump_stats(profile_path)
+            trace["otherData"] = {
+                "profile": profile_path,
+                "hotspots": self._profile_summary(),
+            }
+            logger.info(f"Profile written to: {profile_path}")
+
+        with open(path, "w") as f:
+            json.dump(trace, f)
+        logger.info(f"Trace written to: {path}")
+
+    def _profile_stats(self) -> pstats.Stats:
+        """Merge the main and per-thread profiles."""
+        with self._lock:
+            profilers = [self._profiler] + self._thread_profilers
+        return pstats.Stats(*profilers)
+
+    def _profile_summary(self) -> List[Dict[str, Any]]:
+        """Summarize the hottest functions by cumulative time."""
+        stats = self._profile_stats()
+        rows = []
+        for (filename, line, func), (_, calls, total, cumulative, _) in stats.stats.items():
+            rows.append(
+                {
+                    "function": f"{func} ({os.path.basename(filename)}:{line})",
+                    "calls": calls,
+                    "tottime": round(total, 6),
+                    "cumtime": round(cumulative, 6),
+                }
+            )
+        rows.sort(key=lambda row: row["cumtime"], reverse=True)
+        return rows[:PROFILE_SUMMARY_SIZE]
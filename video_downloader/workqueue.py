@@ -0,0 +1,438 @@
+"""
+Shared work queue for video-downloader.
+
+Lets several workers on different hosts pull download jobs from one
+directory on shared storage. The directory layout is:
+
+- jobs/    one JSON file per queued job (written once, never modified)
+- leases/  one lease file per claimed job, refreshed by heartbeats
+- done/    one JSON file per completed or failed job
+
+Claims and completions rely only on atomic filesystem operations
+(exclusive create, link and rename), so no central coordinator is needed.
+"""
+
+import os
+import json
+import time
+import uuid
+import socket
+import logging
+import threading
+from pathlib import Path
+from typing import Optional, Dict, Any, Iterator, Callable
+
+from .exceptions import VideoDownloaderError, QueueError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LEASE_SECONDS = 60.0
+
+
+class Job:
+    """A job claimed from the work queue."""
+
+    def __init__(self, job_id: str, url: str, is_audio: bool, token: str):
+        """
+        Initialize job.
+
+        Args:
+            job_id: Unique job identifier (file stem in the queue directory)
+            url: URL to download
+            is_audio: Whether to extract audio only
+            token: Lease token proving ownership of this claim
+        """
+        self.job_id = job_id
+        self.url = url
+        self.is_audio = is_audio
+        self.token = token
+
+    def __repr__(self) -> str:
+        return f"Job({self.job_id!r}, {self.url!r})"
+
+
+class WorkQueue:
+    """Directory-backed job queue with leases and heartbeats."""
+
+    def __init__(
+        self,
+        root: Path,
+        worker_id: Optional[str] = None,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+    ):
+        """
+        Initialize work queue.
+
+        Args:
+            root: Queue directory on shared storage (created if missing)
+            worker_id: Identifier recorded in leases. Defaults to hostname:pid
+            lease_seconds: How long a claim stays valid without a heartbeat
+
+        Raises:
+            QueueError: If the queue directory cannot be created
+        """
+        self.root = Path(root)
+        self.jobs_dir = self.root / "jobs"
+        self.leases_dir = self.root / "leases"
+        self.done_dir = self.root / "done"
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.lease_seconds = lease_seconds
+
+        try:
+            for directory in (self.jobs_dir, self.leases_dir, self.done_dir):
+                directory.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            raise QueueError(f"Cannot use queue directory {self.root}: {e}") from e
+
+    def enqueue(self, url: str, is_audio: bool = False) -> str:
+        """
+        Add a job to the queue.
+
+        Args:
+            url: URL to download
+            is_audio: Whether to extract audio only
+
+        Returns:
+            The new job identifier
+
+        Raises:
+            QueueError: If the job file cannot be written
+        """
+        # Time-ordered prefix keeps claims roughly FIFO across hosts
+        job_id = f"{time.time_ns():020d}-{uuid.uuid4().hex[:8]}"
+        payload = {"id": job_id, "url": url, "is_audio": is_audio}
+        try:
+            self._write_atomic(self.jobs_dir / f"{job_id}.json", payload)
+        except OSError as e:
+            raise QueueError(f"Cannot write job to {self.jobs_dir}: {e}") from e
+        logger.info(f"Queued job {job_id}: {url}")
+        return job_id
+
+    def claim(self) -> Optional[Job]:
+        """
+        Claim the next available job.
+
+        Jobs whose lease has expired (e.g. the owning node died) are
+        reclaimed.
+
+        Returns:
+            The claimed job, or None if nothing is available
+        """
+        for job_id in self._pending_ids():
+            token = self._acquire_lease(job_id)
+            if token is None:
+                continue
+
+            # The job may have completed between listing and claiming
+            if self._done_path(job_id).exists():
+                self._release_lease(job_id, token)
+                continue
+
+            try:
+                payload = json.loads(self._job_path(job_id).read_text())
+            except (OSError, ValueError) as e:
+                # Fail this job rather than halting every worker that sorts it first
+                logger.warning(f"Unreadable job file for {job_id}: {e}")
+                self.complete(Job(job_id, "", False, token), error=f"Unreadable job file: {e}")
+                continue
+
+            logger.info(f"Claimed job {job_id}: {payload['url']}")
+            return Job(job_id, payload["url"], bool(payload.get("is_audio")), token)
+
+        return None
+
+    def heartbeat(self, job: Job) -> bool:
+        """
+        Extend the lease on a claimed job.
+
+        Args:
+            job: Job previously returned by claim()
+
+        Returns:
+            True if the lease was extended, False if it was lost to another worker
+        """
+        lease = self._read_lease(job.job_id)
+        if lease is None or lease.get("token") != job.token:
+            logger.warning(f"Lost lease on job {job.job_id}")
+            return False
+
+        # An expired lease may be broken and re-acquired at any moment; never resurrect it
+        if lease.get("expires", 0) < time.time():
+            logger.warning(f"Lease on job {job.job_id} expired before it could be refreshed")
+            return False
+
+        self._write_atomic(self._lease_path(job.job_id), self._lease_payload(job.token))
+        return True
+
+    def complete(self, job: Job, error: Optional[str] = None) -> bool:
+        """
+        Record a job as finished.
+
+        Args:
+            job: Job previously returned by claim()
+            error: Error message if the job failed, None on success
+
+        Returns:
+            True if this call recorded the result, False if it was already recorded
+        """
+        payload = {
+            "id": job.job_id,
+            "url": job.url,
+            "worker": self.worker_id,
+            "finished_at": time.time(),
+            "status": "failed" if error else "ok",
+            "error": error,
+        }
+
+        # Exclusive create guarantees each completion is recorded once
+        try:
+            fd = os.open(self._done_path(job.job_id), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileExistsError:
+            logger.warning(f"Job {job.job_id} was already completed by another worker")
+            self._release_lease(job.job_id, job.token)
+            return False
+
+        with os.fdopen(fd, "w") as f:
+            json.dump(payload, f, indent=2)
+
+        self._release_lease(job.job_id, job.token)
+        logger.info(f"Completed job {job.job_id} ({payload['status']})")
+        return True
+
+    def release(self, job: Job) -> None:
+        """
+        Give up a claimed job without completing it.
+
+        Args:
+            job: Job previously returned by claim()
+        """
+        self._release_lease(job.job_id, job.token)
+        logger.info(f"Released job {job.job_id}")
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Count jobs by state.
+
+        Returns:
+            Dictionary with 'pending', 'leased' and 'done' counts
+        """
+        done = {p.stem for p in self.done_dir.glob("*.json")}
+        jobs = {p.stem for p in self.jobs_dir.glob("*.json")}
+        leased = {p.stem for p in self.leases_dir.glob("*.lease")} - done
+        return {
+            "pending": len(jobs - done - leased),
+            "leased": len(leased),
+            "done": len(done),
+        }
+
+    def _pending_ids(self) -> Iterator[str]:
+        """Yield ids of jobs without a completion record, oldest first."""
+        done = {p.stem for p in self.done_dir.glob("*.json")}
+        for path in sorted(self.jobs_dir.glob("*.json")):
+            if path.stem not in done:
+                yield path.stem
+
+    def _acquire_lease(self, job_id: str) -> Optional[str]:
+        """
+        Try to take the lease for a job.
+
+        Returns:
+            A fresh lease token on success, None if another worker holds it
+        """
+        token = uuid.uuid4().hex
+        lease_path = self._lease_path(job_id)
+
+        # Write the lease aside first so a crash can never leave a half-written lease
+        tmp = lease_path.with_name(f".{lease_path.name}.{token}.tmp")
+        tmp.write_text(json.dumps(self._lease_payload(token)))
+
+        try:
+            for _ in range(2):
+                try:
+                    # link() fails if the lease exists, making the claim atomic
+                    os.link(tmp, lease_path)
+                except FileExistsError:
+                    if not self._break_expired_lease(job_id):
+                        return None
+                    continue
+                return token
+            return None
+        finally:
+            tmp.unlink()
+
+    def _break_expired_lease(self, job_id: str) -> bool:
+        """
+        Remove a lease whose heartbeat has expired.
+
+        Returns:
+            True if the lease was removed and may be re-acquired
+        """
+        lease = self._read_lease(job_id)
+        if lease is None:
+            # Vanished, or left unreadable by a crashed worker: judge it by its age
+            try:
+                age = time.time() - self._lease_path(job_id).stat().st_mtime
+            except FileNotFoundError:
+                return True
+            if age < self.lease_seconds:
+                return False
+        elif lease.get("expires", 0) > time.time():
+            return False
+
+        # Renaming is atomic: only one worker wins the right to break the lease
+        stale = self.leases_dir / f"{job_id}.{uuid.uuid4().hex}.stale"
+        try:
+            os.rename(self._lease_path(job_id), stale)
+        except FileNotFoundError:
+            return True
+
+        # Another worker may have refreshed the lease between our read and the rename
+        try:
+            moved = json.loads(stale.read_text())
+        except (OSError, ValueError):
+            moved = None
+        if moved is not None and (
+            lease is None
+            or moved.get("token") != lease.get("token")
+            or moved.get("expires", 0) > time.time()
+        ):
+            try:
+                # link() refuses to clobber a lease taken in the meantime
+                os.link(stale, self._lease_path(job_id))
+            except OSError:
+                pass
+            stale.unlink()
+            return False
+
+        stale.unlink()
+        owner = lease.get("worker") if lease else "unknown worker"
+        logger.info(f"Reclaimed expired lease on job {job_id} from {owner}")
+        return True
+
+    def _release_lease(self, job_id: str, token: str) -> None:
+        """Remove a lease if it is still held with the given token."""
+        lease = self._read_lease(job_id)
+        if lease is not None and lease.get("token") == token:
+            try:
+                self._lease_path(job_id).unlink()
+            except FileNotFoundError:
+                pass
+
+    def _read_lease(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Read a lease file, returning None if missing or unreadable."""
+        try:
+            return json.loads(self._lease_path(job_id).read_text())
+        except (OSError, ValueError):
+            return None
+
+    def _lease_payload(self, token: str) -> Dict[str, Any]:
+        """Build the contents of a lease file."""
+        return {
+            "token": token,
+            "worker": self.worker_id,
+            "expires": time.time() + self.lease_seconds,
+        }
+
+    def _write_atomic(self, path: Path, payload: Dict[str, Any]) -> None:
+        """Write JSON to a temporary file and rename it into place."""
+        tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        tmp.write_text(json.dumps(payload, indent=2))
+        os.replace(tmp, path)
+
+    def _job_path(self, job_id: str) -> Path:
+        return self.jobs_dir / f"{job_id}.json"
+
+    def _lease_path(self, job_id: str) -> Path:
+        return self.leases_dir / f"{job_id}.lease"
+
+    def _done_path(self, job_id: str) -> Path:
+        return self.done_dir / f"{job_id}.json"
+
+
+class Heartbeat:
+    """Background thread that keeps a job lease alive while it runs."""
+
+    def __init__(self, queue: WorkQueue, job: Job):
+        """
+        Initialize heartbeat.
+
+        Args:
+            queue: Queue that issued the lease
+            job: Claimed job to keep alive
+        """
+        self.queue = queue
+        self.job = job
+        self.lost = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self) -> "Heartbeat":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        """Refresh the lease at a third of its lifetime until stopped."""
+        interval = self.queue.lease_seconds / 3
+        while not self._stop.wait(interval):
+            try:
+                if not self.queue.heartbeat(self.job):
+                    self.lost = True
+                    return
+            except OSError as e:
+                # Transient storage errors: keep trying until the lease expires
+                logger.warning(f"Heartbeat failed for job {self.job.job_id}: {e}")
+
+
+def run_worker(
+    queue: WorkQueue,
+    handler: Callable[[Job], None],
+    poll_interval: float = 5.0,
+    exit_when_empty: bool = True,
+) -> int:
+    """
+    Claim and process jobs until the queue is drained.
+
+    Args:
+        queue: Work queue to pull jobs from
+        handler: Callable that performs the download for a job
+        poll_interval: Seconds to wait before polling again when nothing is claimable
+        exit_when_empty: Stop once no jobs are pending or leased by other workers
+
+    Returns:
+        Number of jobs this worker completed successfully
+    """
+    completed = 0
+
+    while True:
+        job = queue.claim()
+        if job is None:
+            stats = queue.stats()
+            if exit_when_empty and stats["pending"] == 0 and stats["leased"] == 0:
+                return completed
+            # Other workers hold the remaining jobs; wait in case a lease expires
+            time.sleep(poll_interval)
+            continue
+
+        heartbeat = Heartbeat(queue, job)
+        error = None
+        try:
+            with heartbeat:
+                handler(job)
+        except VideoDownloaderError as e:
+            error = str(e)
+        except BaseException:
+            # Give the job back so another node can pick it up immediately
+            queue.release(job)
+            raise
+
+        if heartbeat.lost:
+            # Another worker owns the job now; its result is the one that counts
+            logger.warning(f"Lease on job {job.job_id} was lost while it ran; not recording it")
+            continue
+
+        if queue.complete(job, error=error) and error is None:
+            completed += 1